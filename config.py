@@ -21,7 +21,11 @@ class BaseConfig(object):
     #
     SQLALCHEMY_DATABASE_URI = "sqlite:///test_usint.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {'echo': sqlalchemy_echo}
+    #: Keep enough pooled SQLite connections open for the concurrent worker threads, so requests rarely open a fresh
+    #: connection and rerun the foreign key pragma. Pre-ping and recycling are left off as there is no network connection to go stale.
+    SQLALCHEMY_ENGINE_OPTIONS = {'echo': sqlalchemy_echo,
+                                 'pool_size': 10,
+                                 'max_overflow': 20}
     #
     # --- Session Settings
     #
@@ -32,6 +36,7 @@ class BaseConfig(object):
     # --- Directory Pathing
     #
     OBS_SS = "/data/mta4/obs_ss/"
+    JINJA_CACHE_DIR = None #: Compiled template cache. Defaults to the instance folder if None.
 
 class LocalHostConfig(BaseConfig):
     """
@@ -50,6 +55,7 @@ class CXCWebConfig(BaseConfig):
     SQLALCHEMY_DATABASE_URI = "sqlite:///usint.db"
     TEST_NOTIFICATIONS = False
     TEST_DATABASE = False
+    TEMPLATES_AUTO_RELOAD = False #: Templates only change with a deployment, so skip checking their modification times
 
 _CONFIG_DICT = {
     'localhost': LocalHostConfig,
@@ -16,12 +16,13 @@ import json
 import logging
 
 from flask import Flask, render_template
+from jinja2 import FileSystemBytecodeCache
 from flask_bootstrap import Bootstrap
 from flask_session import Session
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from config import _CONFIG_DICT
-from cus_app.supple.helper_functions import rank_ordr, approx_equals, get_more, IterateRecords, coerce_from_json
+from cus_app.supple.helper_functions import rank_ordr, approx_equals, get_more, iterate_records, coerce_from_json
 
 #
 # --- SQLAlchemy event handler to turn on Foreign Key Constraints for every engine connection.
@@ -55,17 +56,16 @@ function_dict = {
     'datetime': datetime,
     'coerce_notes': lambda x: coerce_from_json(x) or {},
     'get_more': get_more,
-    'IterateRecords': IterateRecords
+    'IterateRecords': iterate_records
 }
 def create_app(_configuration_name):
     """
     Function for instantiating the entire application.
 
     :NOTE: The call for the app.app_context().push() makes the application context available for the later steps of registering webpage blueprints.
-    This is done to make the database available for the scheduler to fetch TOO users, but will make the context available for all webpages.
-    Therefore in future development, it's possible for functional inclusion to be made which require the application context, but the developer is not aware.
+    This was originally done to make the database available for the scheduler to fetch TOO users at import, but will make the context available for all webpages.
+    The scheduler now fetches TOO users on first use within a request, but it's possible for functional inclusion to be made which require the application context, but the developer is not aware.
     Be mindful of editing or removing this function call and verify that which web pages require the application context in order to be registered
-        - Scheduler Page
     https://flask.palletsprojects.com/en/stable/appcontext/
 
     :NOTE: The Usint database interface is supported by a set of interworking interfaces which require an understanding of PRG design approaches.
@@ -91,8 +91,15 @@ def create_app(_configuration_name):
 
     """
     app = Flask(__name__)
-    app.jinja_env.globals.update(function_dict)
     app.config.from_object(_CONFIG_DICT[_configuration_name])
+    #
+    # --- Jinja environment. Created after the configuration so that TEMPLATES_AUTO_RELOAD applies.
+    #
+    app.jinja_env.globals.update(function_dict)
+    #: Keep compiled templates on disk so that each new worker process skips recompiling them.
+    jinja_cache_dir = app.config.get("JINJA_CACHE_DIR") or os.path.join(app.instance_path, 'jinja')
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
     app.config['SESSION_SQLALCHEMY'] = db #: Must set the SQLAlchemy database for server-side session data after construction
     bootstrap.init_app(app)
     db.init_app(app)
@@ -118,6 +125,18 @@ def create_app(_configuration_name):
     #: Register signal for application
     signal.signal(signal.SIGINT, graceful_shutdown)
 
+    #
+    # --- Register the LDAP authenticated user once for every page, before any blueprint handles the request
+    #
+    from flask_login import current_user
+    from cus_app.models import register_user
+
+    @app.before_request
+    def before_request():
+        #: Flask-Login restores the user from the web session, so registration only occurs at the start of a web session.
+        if not current_user.is_authenticated:
+            register_user()
+
     #
     # --- connect all apps with blueprint
     #
@@ -8,23 +8,16 @@ Parameter Check Page
 :Last Updated: May 13, 2025
 
 """
-import os
 import json
 from flask import render_template, request, redirect, url_for, flash
-from flask_login import current_user
 
-from cus_app.models import register_user
 from cus_app.chkupdata import bp
 from cus_app.chkupdata.forms import ObsidRevForm
 import cus_app.supple.database_interface as dbi
 import cus_app.supple.read_ocat_data as rod
 from cus_app.supple.helper_functions import reorient_rank , rank_ordr, coerce, OCAT_DATETIME_FORMAT
+from cus_app.supple.static_data import LABELS as _LABELS, PARAM_SELECTIONS as _PARAM_SELECTIONS
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'labels.json')) as f:
-    _LABELS = json.load(f)
-with open(os.path.join(stat_dir, 'parameter_selections.json')) as f:
-    _PARAM_SELECTIONS = json.load(f)
 
 _FLAG_RANK_COLUMN_ORDR = (
     ('window_flag', 'time_ranks', 'time_columns', 'time_ordr'),
@@ -32,11 +25,6 @@ _FLAG_RANK_COLUMN_ORDR = (
     ('spwindow_flag', 'window_ranks', 'window_columns', 'window_ordr')
 )
 
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
-
 @bp.route('/<obsidrev>', methods=['GET'])
 @bp.route('/index/<obsidrev>', methods=['GET'])
 def index(obsidrev):
@@ -6,14 +6,13 @@
 
 """
 
-import json
-import os
 from datetime import datetime
 from flask          import current_app, flash, url_for
 from flask_login    import current_user
 from email.message import EmailMessage
 from subprocess import Popen, PIPE
 from cus_app.supple.database_interface import pull_revision
+from cus_app.supple.static_data import LABELS as _LABELS
 
 CUS  = 'cus@cfa.harvard.edu'
 ARCOPS = 'arcops@cfa.harvard.edu'
@@ -21,9 +20,6 @@ MP = 'mp@cfa.harvard.edu'
 HRC = 'hrcdude@cfa.harvard.edu'
 ACIS = 'acisdude@cfa.harvard.edu'
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
-with open(os.path.join(stat_dir, 'labels.json')) as f:
-    _LABELS = json.load(f)
 
 def construct_msg(content, subject, to, sender = None, cc = None):
     """
@@ -65,14 +61,14 @@ def send_msg(msg):
                 flash("Error sending notification email. Check Inbox.")
                 send_error_email()
 
-def send_email(content, subject, to, sender = None, cc = []):
+def send_email(content, subject, to, sender = None, cc = None):
     """
     Combined send email function.
 
     :NOTE: This functionality is split only to allow cases in which we'd like to prepare sending emails in bulk before actually sending them.
     In typical usage, the send_email() function will be used across the board.
     """
-    msg = construct_msg(content, subject, to, sender = None, cc = [])
+    msg = construct_msg(content, subject, to, sender = sender, cc = cc)
     send_msg(msg)
 
 def send_error_email(e=None,logline=None):
@@ -122,7 +118,8 @@ def quick_approval_state_email(ocat_data, rev):
     elif rev.kind == 'remove':
         subject = f"Parameter Change Log: {rev.obsidrev()} (Removed)"
         content += "VERIFIED REMOVED\n"
-        approved_revisions = pull_revision(order_by = {'revision_number': 'desc'}, obsid=ocat_data.get('obsid'), kind='asis')
+        #: Only the latest approval is needed, so limit the fetch to it
+        approved_revisions = pull_revision(order_by = {'revision_number': 'desc'}, limit = 1, obsid=ocat_data.get('obsid'), kind='asis')
         if len(approved_revisions) > 0:
             #: If undoing a previous approval, also notify the previous approver
             print(approved_revisions[0])
@@ -135,9 +132,12 @@ def quick_approval_state_email(ocat_data, rev):
     print(to)
     return construct_msg(content, subject, to)
 
-def signoff_notify(ocat_data, rev, sign):
+def signoff_notify_msg(ocat_data, rev, sign):
     """
-    Check the performed signoff for special notification requirements and send those messages.
+    Check the performed signoff for special notification requirements and construct that message.
+
+    :return: Notification message, or None if no notification is required.
+    :rtype: EmailMessage() or None
     """
     if ocat_data.get('obs_type') in ('TOO', 'DDT'):
         #: Notify personnel quickly about updates to a TOO/DDT.
@@ -179,4 +179,4 @@ def signoff_notify(ocat_data, rev, sign):
         else:
             return None #: No email
         
-        send_email(content, subject, to)
\ No newline at end of file
+        return construct_msg(content, subject, to)
\ No newline at end of file
@@ -13,22 +13,15 @@ import json
 from datetime import datetime, timedelta
 
 from flask import current_app, render_template, request, flash, session, redirect, url_for, abort
-from flask_login    import current_user
 from sqlalchemy.orm.exc import NoResultFound
 
 from cus_app import db
-from cus_app.models import register_user
 from cus_app.express import bp
 from cus_app.express.forms import ExpressApprovalForm, ConfirmForm
 from cus_app.supple.read_ocat_data import read_basic_ocat_data
 import cus_app.supple.database_interface as dbi
 from cus_app.supple.helper_functions import create_obsid_list
 
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
-
 @bp.route('/',      methods=['GET', 'POST'])
 @bp.route('/index', methods=['GET', 'POST'])
 def index():
@@ -92,8 +85,7 @@ def finalize():
         for obsid, ocat_data in to_approve.items():
             revision = dbi.construct_revision(obsid,ocat_data,'asis')
             signoff = dbi.construct_signoff(revision)
-            db.session.add(revision)
-            db.session.add(signoff)
+            db.session.add_all((revision, signoff))
         db.session.commit()
     except Exception as e:  # noqa: E722
         #: In the event of an error, roll back the database session to avoid commits instilled by the server-side cookies
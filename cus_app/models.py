@@ -36,7 +36,7 @@ from flask_login import UserMixin, login_user
 from cus_app import db, login
 from typing import Optional, List #: Allows for Mapper to determine nullability of the table column.
 from datetime import datetime
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 class User(db.Model, UserMixin):
@@ -103,7 +103,8 @@ class Revision(db.Model):
     
     """
     __tablename__ = "revisions"
-    __table_args__ = {'extend_existing': True}
+    #: Covers the per-obsid lookups ordered by revision number (latest revision number and latest approval kind).
+    __table_args__ = (Index('ix_revisions_obsid_revision_number', 'obsid', 'revision_number'), {'extend_existing': True})
     
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     obsid: Mapped[int] = mapped_column(nullable=False)
@@ -245,7 +246,8 @@ class Request(db.Model):
     revision: Mapped["Revision"] = relationship(back_populates="request", foreign_keys=revision_id)
         
     parameter_id: Mapped[int] = mapped_column(ForeignKey("parameters.id"))
-    parameter: Mapped["Parameter"] = relationship(back_populates="request", foreign_keys=parameter_id)
+    #: Every reader of these entries looks up the parameter name, so load it in the same query
+    parameter: Mapped["Parameter"] = relationship(back_populates="request", foreign_keys=parameter_id, lazy='joined')
     
     value: Mapped[str] = mapped_column(nullable=True)
 
@@ -273,7 +275,8 @@ class Original(db.Model):
     revision: Mapped["Revision"] = relationship(back_populates="original", foreign_keys=revision_id)
     
     parameter_id: Mapped[int] = mapped_column(ForeignKey("parameters.id"))
-    parameter: Mapped["Parameter"] = relationship(back_populates="original", foreign_keys=parameter_id)
+    #: Every reader of these entries looks up the parameter name, so load it in the same query
+    parameter: Mapped["Parameter"] = relationship(back_populates="original", foreign_keys=parameter_id, lazy='joined')
     #
     #--- By convention, we don't want to store null values in the original state representation of the obsid parameters.
     #--- This can be inferred by the lack of this parameter in the table for a specific revision.
@@ -310,7 +313,7 @@ class Schedule(db.Model):
     #
     # --- order_id acts as changeable identification of the schedule order for easy fetching of adjacent time period entires
     #
-    order_id: Mapped[int] = mapped_column(nullable = True)
+    order_id: Mapped[int] = mapped_column(nullable = True, index = True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable = True)
     user: Mapped["User"] = relationship(back_populates='schedules', foreign_keys=user_id)
     start: Mapped[datetime] = mapped_column(nullable = False)
@@ -7,14 +7,11 @@
 """
 from datetime import datetime
 import os
-import json
 from flask import current_app
 from cus_app.supple.helper_functions import coerce, approx_equals, convert_ra_dec_format, reorient_rank, OCAT_DATETIME_FORMAT
 from cus_app.supple.database_interface import is_approved
+from cus_app.supple.static_data import PARAM_SELECTIONS as _PARAM_SELECTIONS
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'parameter_selections.json')) as f:
-    _PARAM_SELECTIONS = json.load(f)
 
 _FLAG_RANK_COLUMN_ORDR = (
     ('window_flag', 'time_ranks', 'time_columns', 'time_ordr'),
@@ -15,9 +15,8 @@ from wtforms import Field, Form, SelectField, StringField, SubmitField, FormFiel
 from wtforms.validators import DataRequired, NumberRange, Optional
 from wtforms.widgets import Input
 from datetime import datetime
-import json
-import os
 from cus_app.supple.helper_functions import DATETIME_FORMATS
+from cus_app.supple.static_data import LABELS as _LABELS
 
 #
 #---- Common Choice of Pulldown Fields
@@ -39,9 +38,6 @@ _CHOICE_SUBMIT = [("norm", "Normal Change"),
                 ("remove","ObsID no longer ready to go"),
                 ("clone","Split this ObsID")
             ]
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'labels.json')) as f:
-    _LABELS = json.load(f)
 
 class ButtonWidget(Input):
     """
@@ -20,7 +20,6 @@ Session Data
 
 """
 
-import os
 import json
 from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 
@@ -29,26 +28,15 @@ from flask_login    import current_user
 
 from cus_app import db
 import cus_app.emailing as mail
-from cus_app.models import register_user
 from cus_app.ocatdatapage import bp
 from cus_app.ocatdatapage.forms import ConfirmForm, OcatParamForm
 import cus_app.supple.read_ocat_data as rod
 import cus_app.supple.database_interface as dbi
 import cus_app.ocatdatapage.format_ocat_data as fod
 from cus_app.supple.helper_functions import coerce_from_json, create_obsid_list, construct_notes, check_obsid_in_or_list
+from cus_app.supple.static_data import LABELS as _LABELS, PARAM_SELECTIONS as _PARAM_SELECTIONS
 
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'labels.json')) as f:
-    _LABELS = json.load(f)
-with open(os.path.join(stat_dir, 'parameter_selections.json')) as f:
-    _PARAM_SELECTIONS = json.load(f)
-
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
-
 
 @bp.route("/", methods=["GET", "POST"])
 @bp.route("/<obsid>", methods=["GET", "POST"])
@@ -176,6 +164,10 @@ def confirm(obsid=None):
                     else:
                         notes = None
                     multi_rev[extra_obsid] = write_to_database(extra_obsid, extra_ocat_data, kind, notes, extra_org_dict, extra_req_dict)
+                #: Commit the revisions of the main and multi obsids as a single transaction.
+                #: They remain loaded for the notification emails that follow.
+                with dbi.no_expire_on_commit():
+                    db.session.commit()
             except Exception as e:  # noqa: E722
                 #: In the event of an error, roll back the database session to avoid commits instilled by the server-side cookies
                 #: TODO. Do we still clear the session cookies if the database injection failed? I'd assume not...
@@ -275,29 +267,28 @@ def fetch_session_data(obsid):
 
     return ocat_data, warning, orient_maps, ocat_form_dict
 
-def write_to_database(obsid, ocat_data, kind, notes, org_dict, req_dict={}):
+def write_to_database(obsid, ocat_data, kind, notes, org_dict, req_dict = None):
     """
     Perform a set of database injections into the relevant usint.db tables for changes made in the ocatdatapage
 
     :return: Revision object generated by the SQLAlchemy constructions
     :rtype: models.Revision()
     """
+    if req_dict is None:
+        req_dict = {}
     rev = dbi.construct_revision(obsid,ocat_data,kind,notes)
-    db.session.add(rev)
     sign = dbi.construct_signoff(rev,req_dict)
-    db.session.add(sign)
+    db.session.add_all((rev, sign))
+    db.session.flush() #: Assigns the revision id referenced by the original and request rows.
     orgs = dbi.construct_originals(rev, org_dict)
-    for org in orgs:
-        db.session.add(org)
+    reqs = []
     if kind == 'norm':
         reqs = dbi.construct_requests(rev, req_dict)
-        for req in reqs:
-            db.session.add(req)
     elif kind == 'clone':
         only_comment = {'comments': req_dict.get('comments')}
         reqs = dbi.construct_requests(rev, only_comment)
-        for req in reqs:
-            db.session.add(req)
+    #: The caller commits the whole set of revisions once.
+    dbi.insert_entries(orgs, reqs)
     return rev
 
 def determine_msgs(main_ocat_data, main_rev, multi_rev, multi_ocat_data):
@@ -8,29 +8,24 @@ Target Parameter Status Page
 :Last Updated: May 06, 2025
 
 """
-import os
-import json
-from datetime import datetime, timedelta
+import re
+import time
+from itertools import cycle
 
 from flask import render_template, request, session, redirect, url_for, flash
 from flask_login import current_user
 
-from cus_app.models import register_user
+from cus_app import db
+import cus_app.emailing as mail
 from cus_app.orupdate import bp
-from cus_app.orupdate.forms import SignoffRow, OrderForm
+from cus_app.orupdate.forms import OrderForm
 from cus_app.supple.helper_functions import is_open
+from cus_app.supple.static_data import COLORS as _COLORS
 import cus_app.supple.database_interface as dbi
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'color.json')) as f:
-    _COLORS = json.load(f)
-
-_36_HOURS_AGO = (datetime.now() - timedelta(days=1.5)).timestamp()
-
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
+_SIGNOFF_KEY = re.compile(r'(\d+)-(\w+)') #: Signoff button name of signoff id and signoff kind
+_COLOR_VALUES = tuple(_COLORS.values()) #: Rgb strings cycled through to mark obsids with multiple open revisions
+_CLOSED_RETENTION = 1.5 * 86400 #: Seconds to retain closed revisions on the status page (36 hours)
 
 @bp.route('/',      methods=['GET', 'POST'])
 @bp.route('/index', methods=['GET', 'POST'])
@@ -40,11 +35,11 @@ def index():
     """
     #: Process POST request for signoff buttons before displaying parameter status page.
     if request.method == 'POST':
-        for k,v in request.form.to_dict().items():
-            if 'Signoff' in v:
+        for k,v in request.form.items():
+            match = _SIGNOFF_KEY.fullmatch(k)
+            if match and v.startswith('Signoff'):
                 #: Signoff requested. Following the PRG design pattern, perform redirect then come back.
-                signoff_id, signoff_kind = k.split('-')
-                return redirect(url_for('orupdate.perform_signoff', id = signoff_id, kind = signoff_kind))
+                return redirect(url_for('orupdate.perform_signoff', id = match[1], kind = match[2]))
 
     status_page_order_kwarg = session.get('status_page_order_kwarg', {}) #: Pull revision orders by descending submission by default
 
@@ -65,43 +60,31 @@ def index():
 
     session['status_page_order_kwarg'] = status_page_order_kwarg
     result = dbi.pull_status(**status_page_order_kwarg)
+    cutoff = time.time() - _CLOSED_RETENTION #: Evaluated per request so long-lived workers do not drift
 
-    open_revision_signoff = []
-    open_forms =[]
-    open_is_approved = []
+    open_rows = [] #: (Revision, Signoff, approval state) of each open revision
     closed_revision_signoff = []
     multi_revision_info = {}
-
-    count = 0
+    color_iter = cycle(_COLOR_VALUES)
 
     for rev, sign in result:
-        if rev.obsid not in multi_revision_info.keys():
-            multi_revision_info[rev.obsid] = {'opened': [], 'closed': [], 'color': None}
+        info = multi_revision_info.setdefault(rev.obsid, {'opened': [], 'closed': [], 'color': None})
         if is_open(sign):
-            open_revision_signoff.append((rev,sign))
-            open_forms.append(SignoffRow(prefix=str(sign.id)))
-            multi_revision_info[rev.obsid]['opened'].append(rev.revision_number)
-            if dbi.is_approved(rev.obsid):
-                open_is_approved.append(True)
-            else:
-                open_is_approved.append(False)
+            open_rows.append((rev, sign, dbi.is_approved(rev.obsid)))
+            info['opened'].append(rev.revision_number)
             #: Assign a multi color once two open revisions are found, applied to all
-            if len(multi_revision_info[rev.obsid]['opened']) == 2:
-                col = list(_COLORS)[count % len(_COLORS)]
-                multi_revision_info[rev.obsid]['color'] = _COLORS.get(col)
-                count += 1
+            if len(info['opened']) == 2:
+                info['color'] = next(color_iter)
         else:
             #: Limit the retention of closed revisions to the last 1.5 days
-            multi_revision_info[rev.obsid]['closed'].append(rev.revision_number)
-            if rev.time >= _36_HOURS_AGO:
+            info['closed'].append(rev.revision_number)
+            if rev.time >= cutoff:
                 closed_revision_signoff.append((rev,sign))
     return render_template("orupdate/index.html",
                            order_form = order_form,
-                           open_revision_signoff = open_revision_signoff,
-                           open_forms = open_forms,
+                           open_rows = open_rows,
                            closed_revision_signoff = closed_revision_signoff,
-                           multi_revision_info = multi_revision_info,
-                           open_is_approved = open_is_approved
+                           multi_revision_info = multi_revision_info
                            )
 
 @bp.route('/<id>/<kind>', methods=['GET', 'POST'])
@@ -109,5 +92,7 @@ def perform_signoff(id,kind):
     """
     Redirect page for performing the signoff
     """
-    dbi.perform_signoff(id, kind)
+    msgs = dbi.perform_signoff(id, kind)
+    db.session.commit()
+    mail.send_msg(msgs)
     return redirect(url_for('orupdate.index'))
\ No newline at end of file
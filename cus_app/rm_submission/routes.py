@@ -8,22 +8,20 @@ Remove Submission Page
 :Last Updated: May 15, 2025
 
 """
-from datetime import datetime, timedelta
+import re
+import time
 from flask import render_template, request, redirect, url_for
 from flask_login import current_user
 
-from cus_app.models import register_user
 from cus_app.rm_submission import bp
-from cus_app.rm_submission.forms import RemoveRow
 from cus_app.supple.helper_functions import _SIGNOFF_COLUMNS
 import cus_app.supple.database_interface as dbi
 
-_36_HOURS_AGO = (datetime.now() - timedelta(days=1.5)).timestamp()
-
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
+_REMOVE_KEY = re.compile(r'(\d+)-(\d+)-(\w+)') #: Removal button name of revision id, signoff id, and column
+_REVERSIBLE_WINDOW = 1.5 * 86400 #: Seconds in which a submission can be reversed (36 hours)
+_FALLBACK_LIMIT = 10 #: Number of recent entries displayed when nothing is reversible
+#: Column prefix paired with its signoff user, time, and status attribute names of Signoff
+_SIGNOFF_ATTRS = tuple((col, f"{col}_signoff_id", f"{col}_time", f"{col}_status") for col in _SIGNOFF_COLUMNS)
 
 @bp.route('/',      methods=['GET', 'POST'])
 @bp.route('/index', methods=['GET', 'POST'])
@@ -33,39 +31,35 @@ def index():
     """
     #: Process POST request for Removal requests before displaying the latest status of signoffs.
     if request.method == 'POST':
-        for k,v in request.form.to_dict().items():
-            if 'Remove' in v:
-                revision_id, signoff_id, column = k.split('-')
+        for k,v in request.form.items():
+            match = _REMOVE_KEY.fullmatch(k)
+            if match and v.startswith('Remove'):
                 #: Removal requested. Following the PRG design pattern, perform redirect then come back.
-                return redirect(url_for('rm_submission.remove', revision_id = revision_id, signoff_id = signoff_id, column = column))
+                return redirect(url_for('rm_submission.remove', revision_id = match[1], signoff_id = match[2], column = match[3]))
 
-    #: Pull the status information relating to the current user
-    result = dbi.pull_status(user=current_user.id)
+    cutoff = time.time() - _REVERSIBLE_WINDOW #: Evaluated per request so long-lived workers do not drift
+    #: Pull the status information relating to the current user within the reversible window, led by the most recent revisions
+    #: and signoffs of any user.
+    result = dbi.pull_status(user=current_user.id, since=int(cutoff), recent=_FALLBACK_LIMIT)
 
     put_on_page = []
-    removal_forms = []
     
     for rev, sign in result:
-        reversible = find_reversible_column(rev, sign)
+        reversible = find_reversible_column(rev, sign, cutoff)
         if reversible != []: #: Can reverse a status so keep in table.
             put_on_page.append((rev,sign,reversible))
     
-    #: If we cannot reverse anything, then just fetch the most recent revisions and signoffs and put that data up as non_reversible
+    #: If we cannot reverse anything, then just put up the most recent revisions and signoffs as non_reversible
     if put_on_page == []:
         can_remove_submission = False
-        result = dbi.pull_status(limit=10)
-        for rev, sign in result:
+        for rev, sign in result[:_FALLBACK_LIMIT]:
             put_on_page.append((rev,sign,[]))
     else:
         can_remove_submission = True
-    
-    if can_remove_submission:
-        #: Populate form with information to allow removal
-        for rev,sign,reversible in put_on_page:
-            removal_forms.append(RemoveRow(prefix=f"{rev.id}-{sign.id}")) #: Depending on the submitted button time, we will adjust either the signoff or the revision
+    #: Removal buttons are rendered directly in the template from the reversible columns of each entry.
+    #: Depending on the submitted button, we will adjust either the signoff or the revision
     return render_template("rm_submission/index.html",
                            put_on_page = put_on_page,
-                           removal_forms = removal_forms,
                            can_remove_submission = can_remove_submission,
                            _SIGNOFF_COLUMNS = _SIGNOFF_COLUMNS
                            )    
@@ -78,25 +72,23 @@ def remove(revision_id, signoff_id, column):
     dbi.remove(revision_id, signoff_id, column)
     return redirect(url_for('rm_submission.index'))
 
-def find_reversible_column(rev, sign):
+def find_reversible_column(rev, sign, cutoff):
     """
     Check if the specific signoff or revision involving the current user is within the last 36 hours.
     If so, record it as reversible based on column in signoff and string marking revision
+
+    :param cutoff: Epoch time of the start of the reversible window
     """
     reversible = []
-    for sign_col in _SIGNOFF_COLUMNS:
+    user_id = current_user.id
+    for sign_col, signoff_attr, time_attr, _ in _SIGNOFF_ATTRS:
         #: Any present signoff can be undone at any time provided it's by the original user
-        if getattr(sign, f"{sign_col}_signoff_id") == current_user.id:
-            if getattr(sign, f"{sign_col}_time") >= _36_HOURS_AGO:
+        if getattr(sign, signoff_attr) == user_id:
+            if getattr(sign, time_attr) >= cutoff:
                 reversible.append(sign_col)
-    if rev.user_id == current_user.id:
-        if rev.time >= _36_HOURS_AGO:
+    if rev.user_id == user_id:
+        if rev.time >= cutoff:
             #: A revision can only be removed if there are no signed statuses remaining
-            revision_reverse = True
-            for sign_col in _SIGNOFF_COLUMNS:
-                if getattr(sign, f"{sign_col}_status") == 'Signed':
-                    revision_reverse = False
-                    break
-            if revision_reverse:
+            if not any(getattr(sign, status_attr) == 'Signed' for *_, status_attr in _SIGNOFF_ATTRS):
                 reversible.append('revision')
     return reversible
\ No newline at end of file
@@ -5,43 +5,65 @@
 :Last Updated: May 19, 2025
 
 """
-from flask_wtf import FlaskForm
-from wtforms import SubmitField, SelectField
+from functools import lru_cache
+from wtforms import Form, SubmitField, SelectField
 
 from cus_app import db
 from cus_app.models import User
-from sqlalchemy import select
+from sqlalchemy import select, event
 from calendar import month_name
 from datetime import datetime
 
 #
 # --- Define globals for form
 #
-_TOO_USERS = db.session.execute(select(User).where(User.groups.like('%too%'))).scalars().all()
-_USER_CHOICE = [(None, 'TBD')] + [(user.id, user.full_name) for user in _TOO_USERS]
-#: Iterated over to match
-_MONTH_CHOICE = [(name, name) for name in list(month_name[1:])]
-_DAY_CHOICE = [(f"{i:>02}", f"{i:>02}") for i in range(1,32)]
-_YEAR_CHOICE = [(str(i),str(i)) for i in range(datetime.now().year - 1, datetime.now().year + 3)]
-
-class ScheduleRow(FlaskForm):
+@lru_cache(maxsize=1)
+def _user_choices():
+    """
+    Selection choices of the TOO users. Queried on first use within a request rather than at import,
+    and cached until a User entry is inserted or updated.
+    """
+    too_users = db.session.execute(select(User).where(User.groups.like('%too%'))).scalars().all()
+    return [(None, 'TBD')] + [(user.id, user.full_name) for user in too_users]
+
+@event.listens_for(User, 'after_insert')
+@event.listens_for(User, 'after_update')
+def _clear_user_choices(mapper, connection, target):
+    _user_choices.cache_clear()
+
+#: Month and day numbers, matching the integer attributes of the scheduled datetimes
+_MONTH_CHOICE = tuple((i, month_name[i]) for i in range(1,13))
+_DAY_CHOICE = tuple((i, f"{i:>02}") for i in range(1,32))
+
+def _year_choices():
+    """
+    Selection choices for the year, sliding with the current year rather than fixed at import.
+    """
+    year = datetime.now().year
+    return [(i, str(i)) for i in range(year - 1, year + 3)]
+
+class ScheduleRow(Form):
     """
     To make use of pairing form actions to a schedule entry id,
     we will only use one form per time period entry, and depending on whether a person is 
     signed up for the period or not will impact which form fields are rendered.
+    Choices are given as shared tuples or callables so that no per-row choice lists are bound.
+
+    :Note: The rows are only rendered and never validated, as the POST handler reads the submitted button from the request form.
+        They therefore derive from the plain WTForms Form, without the CSRF metadata and token of FlaskForm.
 
     :Note: No field is rendered in the schedule page if the time period has already passed.
     """
     #: Rendered if a user is not assigned for a time period entry
-    user = SelectField("Contact", choices=_USER_CHOICE)
-    start_month = SelectField("Month", choices=_MONTH_CHOICE)
-    start_day = SelectField("Date", choices=_DAY_CHOICE)
-    start_year = SelectField("Year", choices=_YEAR_CHOICE)
-    stop_month = SelectField("Month", choices=_MONTH_CHOICE)
-    stop_day = SelectField("Date", choices=_DAY_CHOICE)
-    stop_year = SelectField("Year", choices=_YEAR_CHOICE)
+    user = SelectField("Contact", choices=_user_choices)
+    start_month = SelectField("Month", choices=_MONTH_CHOICE, coerce=int)
+    start_day = SelectField("Date", choices=_DAY_CHOICE, coerce=int)
+    start_year = SelectField("Year", choices=_year_choices, coerce=int)
+    stop_month = SelectField("Month", choices=_MONTH_CHOICE, coerce=int)
+    stop_day = SelectField("Date", choices=_DAY_CHOICE, coerce=int)
+    stop_year = SelectField("Year", choices=_year_choices, coerce=int)
     update = SubmitField("Update")
     split = SubmitField("Split")
     delete = SubmitField("Delete")
     #: Rendered if a user is assigned to the time period entry
-    unlock = SubmitField("Unlock")
\ No newline at end of file
+    unlock = SubmitField("Unlock")
@@ -8,20 +8,14 @@ TOO Schedule Page
 :Last Updated: May 19, 2025
 
 """
-from flask import render_template, request, redirect, url_for
-from flask_login import current_user
+from datetime import date
+from flask import render_template, request, redirect, url_for, flash
 
-from cus_app.models import register_user
 from cus_app.scheduler import bp
 from cus_app.scheduler.forms import ScheduleRow
 import cus_app.supple.database_interface as dbi
 
 
-@bp.before_app_request
-def before_request():
-    if not current_user.is_authenticated:
-        register_user()
-
 @bp.route('/',      methods=['GET', 'POST'])
 @bp.route('/index', methods=['GET', 'POST'])
 def index():
@@ -33,27 +27,12 @@ def index():
         #
         # --- Only one submit button will be present per request, so iterate and find it
         #
-        form_dict = request.form.to_dict()
+        form_dict = request.form
         for k,v in form_dict.items():
-            if 'Unlock' in v:
-                schedule_id = k.split('-')[0]
-                #: Unlock requested. Following the PRG design pattern, perform redirect then come back.
-                return redirect(url_for('scheduler.unlock', schedule_id = schedule_id))
-            if 'Update' in v:
-                schedule_id = k.split('-')[0]
-                user_id = form_dict[f'{schedule_id}-user']
-                #: Cannot record the start and stop strings in the url as back slashes since the browser interprets that as a different page.
-                start_string = form_dict[f"{schedule_id}-start_month"] + "-" + form_dict[f"{schedule_id}-start_day"] + "-" + form_dict[f"{schedule_id}-start_year"]
-                stop_string = form_dict[f"{schedule_id}-stop_month"] + "-" + form_dict[f"{schedule_id}-stop_day"] + "-" + form_dict[f"{schedule_id}-stop_year"]
-                #: Update requested. Following the PRG design pattern, perform redirect then come back.
-                return redirect(url_for('scheduler.update', schedule_id = schedule_id, user_id = user_id, start_string = start_string, stop_string = stop_string))
-            if 'Split' in v:
-                schedule_id = k.split('-')[0]
-                return redirect(url_for('scheduler.split', schedule_id = schedule_id))
-            if 'Delete' in v:
-                schedule_id = k.split('-')[0]
-                return redirect(url_for('scheduler.delete', schedule_id = schedule_id))
-
+            action = _ACTIONS.get(v)
+            if action is not None:
+                #: Action requested. Following the PRG design pattern, perform redirect then come back.
+                return action(form_dict, k.split('-')[0])
 
     schedule_list = dbi.pull_schedule()
     schedule_forms = []
@@ -98,18 +77,48 @@ def delete(schedule_id):
     dbi.delete_schedule_entry(schedule_id)
     return redirect(url_for('scheduler.index'))
 
+#
+# --- POST actions. Each returns the PRG redirect for the schedule id of the submitted button.
+#
+def _unlock_action(form_dict, schedule_id):
+    return redirect(url_for('scheduler.unlock', schedule_id = schedule_id))
+
+def _update_action(form_dict, schedule_id):
+    prefix = f"{schedule_id}-" #: Field name prefix of the schedule entry's form
+    user_id = form_dict[prefix + 'user']
+    try:
+        start = date(int(form_dict[prefix + 'start_year']), int(form_dict[prefix + 'start_month']), int(form_dict[prefix + 'start_day']))
+        stop = date(int(form_dict[prefix + 'stop_year']), int(form_dict[prefix + 'stop_month']), int(form_dict[prefix + 'stop_day']))
+    except ValueError:
+        flash("Selected date does not exist. Please Correct.")
+        return redirect(url_for('scheduler.index'))
+    #: Record the start and stop as ISO 8601 strings in the url, as back slashes are interpreted by the browser as a different page.
+    return redirect(url_for('scheduler.update', schedule_id = schedule_id, user_id = user_id, start_string = start.isoformat(), stop_string = stop.isoformat()))
+
+def _split_action(form_dict, schedule_id):
+    return redirect(url_for('scheduler.split', schedule_id = schedule_id))
+
+def _delete_action(form_dict, schedule_id):
+    return redirect(url_for('scheduler.delete', schedule_id = schedule_id))
+
+_ACTIONS = {'Unlock': _unlock_action,
+            'Update': _update_action,
+            'Split': _split_action,
+            'Delete': _delete_action,
+            } #: Submit button value to its POST action
+
 def prep_form(entry):
     """
     Prepare form starting data for the particular entry
     """
     kwarg = {'prefix': str(entry.id)}
     data = {'user': entry.user_id,
-            'start_month': entry.start.strftime('%B'),
-            'start_day': entry.start.strftime('%d'),
-            'start_year': entry.start.strftime('%Y'),
-            'stop_month': entry.stop.strftime('%B'),
-            'stop_day': entry.stop.strftime('%d'),
-            'stop_year': entry.stop.strftime('%Y'),
+            'start_month': entry.start.month,
+            'start_day': entry.start.day,
+            'start_year': entry.start.year,
+            'stop_month': entry.stop.month,
+            'stop_day': entry.stop.day,
+            'stop_year': entry.stop.year,
             }
     kwarg['data'] = data
     return kwarg
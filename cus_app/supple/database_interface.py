@@ -17,30 +17,62 @@ Such instances would be using the current_user.id rather than the current_user O
 In other cases, this is not possible, for example when adding a Revision and Signoff table entires in a web request. This is not possible because it is not known
 what Primary Key is available in those tables until database transaction time.
 """
-import os
 from datetime import datetime, timedelta
-import json
-from sqlalchemy import select, desc, case, text, or_, delete
-from sqlalchemy.orm.exc import NoResultFound
+import re
+import time
+from contextlib import contextmanager
+from sqlalchemy import select, insert, update, asc, desc, case, or_, and_, delete, func, bindparam
+from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm.exc import NoResultFound, MultipleResultsFound
 from cus_app import db
 import cus_app.emailing as mail
 from cus_app.models import User, Revision, Signoff, Parameter, Request, Original, Schedule
 from flask import flash
 from flask_login import current_user
-from cus_app.supple.helper_functions import coerce_to_json, DATETIME_FORMATS, is_open, get_next_weekday, coerce
+from cus_app.supple.helper_functions import coerce_to_json, DATETIME_FORMATS, get_next_weekday, coerce
 from cus_app.supple.read_ocat_data import read_basic_ocat_data
+from cus_app.supple.static_data import PARAM_SELECTIONS as _PARAM_SELECTIONS
 from calendar import MONDAY, SUNDAY
 
-stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
-with open(os.path.join(stat_dir, 'parameter_selections.json')) as f:
-    _PARAM_SELECTIONS = json.load(f)
+#: Parameters requiring each kind of signoff, as sets for membership checks
+_GENERAL_SIGNOFF_PARAMS = frozenset(_PARAM_SELECTIONS['general_signoff_params'])
+_ACIS_SIGNOFF_PARAMS = frozenset(_PARAM_SELECTIONS['acis_signoff_params'])
+_ACIS_SI_SIGNOFF_PARAMS = frozenset(_PARAM_SELECTIONS['acis_si_signoff_params'])
+_HRC_SI_SIGNOFF_PARAMS = frozenset(_PARAM_SELECTIONS['hrc_si_signoff_params'])
+_ALL_SIGNOFF_PARAMS = _GENERAL_SIGNOFF_PARAMS | _ACIS_SIGNOFF_PARAMS | _ACIS_SI_SIGNOFF_PARAMS | _HRC_SI_SIGNOFF_PARAMS
+
+
+@contextmanager
+def no_expire_on_commit():
+    """
+    Keep the session's ORM objects loaded through a commit, so that reading them afterwards,
+    such as for notification emails, does not reload each one from the database.
+    """
+    session = db.session()
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
+
+def _get_one(model, ident, **kwargs):
+    """
+    Fetch a table entry by primary key, checking the session's identity map before querying the database.
+
+    :raises NoResultFound: If no entry has the primary key, as select(...).scalar_one() would.
+    """
+    entry = db.session.get(model, int(ident), **kwargs)
+    if entry is None:
+        raise NoResultFound(f"No {model.__name__} with id {ident}")
+    return entry
 
 def construct_revision(obsid,ocat_data,kind,notes = None):
     """
     Generate a Revision ORM object based on the provided obsid information
     """
     rev_no = find_next_rev_no(obsid)
-    curr_epoch = int(datetime.now().timestamp())
+    curr_epoch = int(time.time())
     revision = Revision(obsid = int(obsid),
                     revision_number = rev_no,
                     kind = kind,
@@ -51,7 +83,7 @@ def construct_revision(obsid,ocat_data,kind,notes = None):
                     )
     return revision
 
-def construct_signoff(rev_obj, req_dict={}):
+def construct_signoff(rev_obj, req_dict = None):
     """
     Determine the Signoffs entry based on the revision object based in kind:(norm, asis, remove, clone).
     The signoff status options are : ('Signed', 'Not Required', 'Pending', 'Discard').
@@ -73,7 +105,7 @@ def construct_signoff(rev_obj, req_dict={}):
                     )
     elif rev_obj.kind == 'norm':
         #: Determine based on change requests linked to the revision object
-        gen, acis, acis_si, hrc_si =  determine_signoff(req_dict)
+        gen, acis, acis_si, hrc_si =  determine_signoff(req_dict or {})
         signoff = Signoff(revision=rev_obj,
                           general_status = gen,
                           acis_status = acis,
@@ -86,8 +118,8 @@ def construct_signoff(rev_obj, req_dict={}):
 def construct_auto_signoff(rev_obj):
     """
     Automatically fill a usint signoff ORM without other signoffs.
+    The usint signoff is made at the same epoch time as the revision.
     """
-    curr_epoch = int(datetime.now().timestamp())
     signoff = Signoff(revision = rev_obj,
                             general_status = 'Not Required',
                             acis_status = 'Not Required',
@@ -95,133 +127,143 @@ def construct_auto_signoff(rev_obj):
                             hrc_si_status = 'Not Required',
                             usint_status = 'Signed',
                             usint_signoff_id = rev_obj.user_id,
-                            usint_time = curr_epoch
+                            usint_time = rev_obj.time
                     )
     return signoff
 
+#: Status, signoff user id, and signoff time attribute names of Signoff updated by each kind of signoff
+_SIGNOFF_FIELDS = {'gen': ('general_status', 'general_signoff_id', 'general_time'),
+                   'acis': ('acis_status', 'acis_signoff_id', 'acis_time'),
+                   'acis_si': ('acis_si_status', 'acis_si_signoff_id', 'acis_si_time'),
+                   'hrc_si': ('hrc_si_status', 'hrc_si_signoff_id', 'hrc_si_time'),
+                   'usint': ('usint_status', 'usint_signoff_id', 'usint_time'),
+                   'approve': ('usint_status', 'usint_signoff_id', 'usint_time'),
+                   }
+
 def perform_signoff(signoff_id, signoff_kind):
     """
-    Update the signoff entry matching to the provided id
+    Update the signoff entry matching to the provided id. The caller is responsible for committing the session,
+    then sending the returned notifications so that no email is sent while the transaction is open.
 
     :param signoff_kind: String determining the kind of signoff to provide (gen, acis, acis_si, hrc_si, usint, approve)
-    """
-    signoff_id = int(signoff_id)
-    curr_epoch = int(datetime.now().timestamp())
-    signoff_obj = db.session.execute(select(Signoff).where(Signoff.id == signoff_id)).scalar_one()
+    :return: Notification messages to send after the commit
+    :rtype: list(EmailMessage())
+    """
+    fields = _SIGNOFF_FIELDS.get(signoff_kind)
+    if fields is None:
+        flash(f"Unknown signoff kind: {signoff_kind}. No signoff performed.")
+        return []
+    msgs = []
+    curr_epoch = int(time.time())
+    #: The revision is always read, so load it with the signoff in one round trip.
+    signoff_obj = _get_one(Signoff, signoff_id, options=(joinedload(Signoff.revision),))
     matching_rev = signoff_obj.revision
     ocat_data = read_basic_ocat_data(matching_rev.obsid)
-    if signoff_kind == 'gen':
-        signoff_obj.general_status = 'Signed'
-        signoff_obj.general_signoff_id = current_user.id
-        signoff_obj.general_time = curr_epoch
-    elif signoff_kind == 'acis':
-        signoff_obj.acis_status = 'Signed'
-        signoff_obj.acis_signoff_id = current_user.id
-        signoff_obj.acis_time = curr_epoch
-    elif signoff_kind == 'acis_si':
-        signoff_obj.acis_si_status = 'Signed'
-        signoff_obj.acis_si_signoff_id = current_user.id
-        signoff_obj.acis_si_time = curr_epoch
-    elif signoff_kind == 'hrc_si':
-        signoff_obj.hrc_si_status = 'Signed'
-        signoff_obj.hrc_si_signoff_id = current_user.id
-        signoff_obj.hrc_si_time = curr_epoch
-    elif signoff_kind in ('usint', 'approve'):
-        signoff_obj.usint_status = 'Signed'
-        signoff_obj.usint_signoff_id = current_user.id
-        signoff_obj.usint_time = curr_epoch
-        if signoff_kind == 'approve':
-            if not is_approved(matching_rev.obsid):
-                #: Additionally create an approval revision and signoff.
-                new_revision = Revision(obsid = matching_rev.obsid,
-                                        revision_number = find_next_rev_no(matching_rev.obsid),
-                                        kind = 'asis',
-                                        sequence_number = matching_rev.sequence_number,
-                                        time = curr_epoch,
-                                        user_id = current_user.id
-                )
-                new_signoff = construct_auto_signoff(new_revision)
-                db.session.add(new_revision)
-                db.session.add(new_signoff)
-                #: Also send notification email if performing this special approval signoff
-                msg = mail.quick_approval_state_email(ocat_data, new_revision)
-                mail.send_msg(msg)
-            else:
-                flash(f"Obsid {signoff_obj.revision.obsid} already approved. Performing only Usint Signoff.")
-    mail.signoff_notify(ocat_data, matching_rev, signoff_obj)
-    db.session.commit()
+    status_attr, signoff_attr, time_attr = fields
+    setattr(signoff_obj, status_attr, 'Signed')
+    setattr(signoff_obj, signoff_attr, current_user.id)
+    setattr(signoff_obj, time_attr, curr_epoch)
+    if signoff_kind == 'approve':
+        if not is_approved(matching_rev.obsid):
+            #: Additionally create an approval revision and signoff.
+            new_revision = Revision(obsid = matching_rev.obsid,
+                                    revision_number = find_next_rev_no(matching_rev.obsid),
+                                    kind = 'asis',
+                                    sequence_number = matching_rev.sequence_number,
+                                    time = curr_epoch,
+                                    user_id = current_user.id
+            )
+            new_signoff = construct_auto_signoff(new_revision)
+            db.session.add_all((new_revision, new_signoff))
+            #: Also send notification email if performing this special approval signoff
+            msgs.append(mail.quick_approval_state_email(ocat_data, new_revision))
+        else:
+            flash(f"Obsid {signoff_obj.revision.obsid} already approved. Performing only Usint Signoff.")
+    msg = mail.signoff_notify_msg(ocat_data, matching_rev, signoff_obj)
+    if msg is not None:
+        msgs.append(msg)
+    #: Only flush so that several signoffs can share one transaction. The caller commits.
+    db.session.flush()
+    return msgs
+
+def _parameter_rows(rev_obj, pairs):
+    """
+    Construct table rows of the revision for the (parameter name, value) pairs which are signoff parameters.
+    """
+    return [{'revision_id': rev_obj.id, 'parameter_id': pull_param_id(key), 'value': coerce_to_json(value)}
+            for key, value in pairs if key in _ALL_SIGNOFF_PARAMS]
 
 def construct_requests(rev_obj, req_dict):
     """
-    Construct a list of Request ORM's for insertion.
+    Construct a list of Request table rows for a bulk insertion. The revision must be flushed beforehand so that it has an id.
     """
-    all_requests = []
-    for key, value in req_dict.items():
-        if key in _PARAM_SELECTIONS["general_signoff_params"] + _PARAM_SELECTIONS["acis_signoff_params"] + _PARAM_SELECTIONS["acis_si_signoff_params"] + _PARAM_SELECTIONS["hrc_si_signoff_params"]:
-            param = pull_param(key)
-            req = Request(revision_id= rev_obj.id,
-                        parameter_id = param.id,
-                        value = coerce_to_json(value)
-            )
-            all_requests.append(req)
-    return all_requests
+    return _parameter_rows(rev_obj, req_dict.items())
 
 def construct_originals(rev_obj, org_dict):
     """
-    Construct a list of Original ORM's for insertion. Only adding non-null values as null is inferred.
+    Construct a list of Original table rows for a bulk insertion. Only adding non-null values as null is inferred.
+    The revision must be flushed beforehand so that it has an id.
     """
-    all_originals = []
-    for key, value in org_dict.items():
-        if value is not None:
-            if key in _PARAM_SELECTIONS["general_signoff_params"] + _PARAM_SELECTIONS["acis_signoff_params"] + _PARAM_SELECTIONS["acis_si_signoff_params"] + _PARAM_SELECTIONS["hrc_si_signoff_params"]:
-                param = pull_param(key)
-                req = Original(revision_id= rev_obj.id,
-                            parameter_id = param.id,
-                            value = coerce_to_json(value)
-                )
-                all_originals.append(req)
-    return all_originals
+    return _parameter_rows(rev_obj, ((key, value) for key, value in org_dict.items() if value is not None))
+
+def insert_entries(originals, requests):
+    """
+    Bulk insert the Original and Request table rows of a revision, bypassing the per-object ORM unit of work.
+    """
+    if originals:
+        db.session.execute(insert(Original), originals)
+    if requests:
+        db.session.execute(insert(Request), requests)
 
 def determine_signoff(req_dict):
     """
     Read the requested changes and determine what kind of signoff is necessary.
     """
-    gen = 'Not Required'
-    acis = 'Not Required'
-    acis_si = 'Not Required'
-    hrc_si = 'Not Required'
-    #: Iterate through the requested parameter changes and define their signoff.
-    for key in req_dict.keys():
-        if key in _PARAM_SELECTIONS['general_signoff_params']:
-            gen = 'Pending'
-        if key in _PARAM_SELECTIONS['acis_signoff_params']:
-            acis = 'Pending'
-        if key in _PARAM_SELECTIONS['acis_si_signoff_params']:
-            acis_si = 'Pending'
-        if key in _PARAM_SELECTIONS['hrc_si_signoff_params']:
-            hrc_si = 'Pending'
+    keys = req_dict.keys()
+    #: A signoff is pending if any requested parameter change falls under it.
+    gen = 'Not Required' if _GENERAL_SIGNOFF_PARAMS.isdisjoint(keys) else 'Pending'
+    acis = 'Not Required' if _ACIS_SIGNOFF_PARAMS.isdisjoint(keys) else 'Pending'
+    acis_si = 'Not Required' if _ACIS_SI_SIGNOFF_PARAMS.isdisjoint(keys) else 'Pending'
+    hrc_si = 'Not Required' if _HRC_SI_SIGNOFF_PARAMS.isdisjoint(keys) else 'Pending'
     return gen, acis, acis_si, hrc_si
 
+#
+# --- Statements repeated across requests, built once so that only their parameters are bound per call
+#
+_USER_BY_NAME = select(User).where(User.username == bindparam('username'))
+_MAX_REV_NO = select(func.coalesce(func.max(Revision.revision_number), 0)).where(Revision.obsid == bindparam('obsid'))
+_LATEST_APPROVAL_KIND = select(Revision.kind).where(Revision.obsid == bindparam('obsid'), Revision.kind.in_(('asis', 'remove'))).order_by(desc(Revision.revision_number)).limit(1)
+#: Matches the is_open() check of a signoff, evaluated in the database
+_HAS_OPEN_REVISION = select(select(Revision.id).join(Revision.signoff).where(Revision.obsid == bindparam('obsid'),
+                                                                             or_(Signoff.general_status == 'Pending',
+                                                                                 Signoff.acis_status == 'Pending',
+                                                                                 Signoff.acis_si_status == 'Pending',
+                                                                                 Signoff.hrc_si_status == 'Pending',
+                                                                                 Signoff.usint_status == 'Pending'
+                                                                                 )).exists())
+
 def user_by_name(username):
     """
     Return User ORM matching provide username. Returns None if no user matches that name.
     """
-    return db.session.execute(select(User).where(User.username == username)).scalars().first()
+    return db.session.execute(_USER_BY_NAME, {'username': username}).scalars().first()
 
-def pull_param(param):
+_PARAM_IDS = {} #: Parameter name to id. The parameter table is static reference data, so it's read once per process.
+
+def pull_param_id(param):
     """
-    Fetch the Parameter ORM by name.
+    Fetch the Parameter id by name, reading the whole parameter table on the first lookup.
     Will return an SQLAlchemy.orm.exc.NoResultFound if the parameter is not in the table
     """
-    try:
-        result = db.session.execute(select(Parameter).where(Parameter.name == param)).scalar_one()
-    except NoResultFound:
-        #: Return same error with more specifics
-        raise NoResultFound(f"No result for '{param}' parameter search in table.")
+    if param not in _PARAM_IDS:
+        _PARAM_IDS.update(db.session.execute(select(Parameter.name, Parameter.id)).tuples().all())
+        if param not in _PARAM_IDS:
+            raise NoResultFound(f"No result for '{param}' parameter search in table.")
+    return _PARAM_IDS[param]
 
-    return result
+_ORDER_DIRECTIONS = {'asc': asc, 'desc': desc} #: Ordering direction names accepted by pull_revision
 
-def pull_revision(order_by = {'id': 'asc'}, **kwargs):
+def pull_revision(order_by = None, **kwargs):
     """
     Fetch list of recent revisions based on kwarg criteria
     """
@@ -253,16 +295,28 @@ def pull_revision(order_by = {'id': 'asc'}, **kwargs):
     
     #: By default, order the query by descending Revision ID number so that the end result order
     #: contains a suborder of returning the most recently made revisions first.
-    ordering = ",".join([f"{k} {v}" for k,v in order_by.items()])
-    query = query.order_by(text(ordering))
+    if order_by is None:
+        order_by = {'id': 'asc'}
+    #: Ordering is restricted to Revision table columns and known directions rather than raw SQL text.
+    query = query.order_by(*(_ORDER_DIRECTIONS[v.lower()](Revision.__table__.c[k]) for k,v in order_by.items()))
     return db.session.execute(query).scalars().all()
 
+_STATUS_USER_LOADS = (selectinload(Revision.user),
+                      selectinload(Signoff.general_signoff),
+                      selectinload(Signoff.acis_signoff),
+                      selectinload(Signoff.acis_si_signoff),
+                      selectinload(Signoff.hrc_si_signoff),
+                      selectinload(Signoff.usint_signoff)
+                      )
+
 def pull_status(limit = 200, **kwargs):
     """
     Pull Revisions and Signoffs in specific ordering.
 
     :param limit: _description_, defaults to 200
     :type limit: int, optional
+    :param user: Only pull entries involving this user id, optionally with the ``recent`` number of latest entries of any user
+        and optionally only those with activity ``since`` an epoch time
     :return: Recent (Revision, Signoff) in descending order.
     """
     if 'order_user' in kwargs.keys():
@@ -271,9 +325,9 @@ def pull_status(limit = 200, **kwargs):
         query = select(Revision, Signoff).join(Revision.signoff).order_by(case((Revision.user_id == order_user, 0),else_=1)).order_by(desc(Revision.id)).limit(limit)
 
     elif kwargs.get('order_obsid'):
-        #: Special case in which we must first subquery the most recent LIMIT number of revisions, then sort by obsid
-        subquery = select(Revision.id).order_by(desc(Revision.id)).limit(limit).subquery()
-        query = select(Revision, Signoff).join(Revision.signoff).select_from(Revision, subquery).where(Revision.id == subquery.c.id).order_by(Revision.obsid).order_by(desc(Revision.revision_number))
+        #: Special case in which we must first select the most recent LIMIT number of revisions, then sort by obsid
+        recent = select(Revision.id).order_by(desc(Revision.id)).limit(limit).cte('recent')
+        query = select(Revision, Signoff).join(Revision.signoff).join(recent, Revision.id == recent.c.id).order_by(Revision.obsid).order_by(desc(Revision.revision_number))
     elif 'user' in kwargs.keys():
         #Pull only the signoffs and revisions involving this user
         user_id = int(kwargs.get('user'))
@@ -284,10 +338,28 @@ def pull_status(limit = 200, **kwargs):
                   Signoff.hrc_si_signoff_id == user_id,
                   Signoff.usint_signoff_id == user_id
                  )
+        if kwargs.get('since') is not None:
+            #: Only those with a revision or signoff made since the provided epoch time
+            since = int(kwargs['since'])
+            user_wheres = and_(user_wheres, or_(Revision.time >= since,
+                                                Signoff.general_time >= since,
+                                                Signoff.acis_time >= since,
+                                                Signoff.acis_si_time >= since,
+                                                Signoff.hrc_si_time >= since,
+                                                Signoff.usint_time >= since
+                                                ))
+        recent = int(kwargs.get('recent', 0))
+        if recent:
+            #: Also include the most recent revisions of any user. Being the newest, they lead the descending order.
+            recent_ids = select(Revision.id).order_by(desc(Revision.id)).limit(recent).scalar_subquery()
+            user_wheres = or_(user_wheres, Revision.id.in_(recent_ids))
+            limit += recent
         query = select(Revision, Signoff).join(Revision.signoff).filter(user_wheres).order_by(desc(Revision.id)).limit(limit)
     else:
         #: Default descending order
         query = select(Revision, Signoff).join(Revision.signoff).order_by(desc(Revision.id)).limit(limit)
+    #: The status pages display the username of every revision and signoff, so load those users in batches with the result
+    query = query.options(*_STATUS_USER_LOADS)
     return db.session.execute(query).all()
 
 def find_next_rev_no(obsid):
@@ -297,11 +369,8 @@ def find_next_rev_no(obsid):
     :return: Next revision number
     :rtype: int
     """
-    revision_numbers = db.session.execute(select(Revision.revision_number).where(Revision.obsid == obsid)).scalars().all()
-    if len(revision_numbers) == 0:
-        return 1
-    else:
-        return max(revision_numbers) + 1
+    #: An obsid without revisions has a maximum revision number of 0
+    return db.session.execute(_MAX_REV_NO, {'obsid': obsid}).scalar() + 1
 
 def is_approved(obsid):
     """
@@ -310,14 +379,9 @@ def is_approved(obsid):
     :rtype: bool
     """
     obsid = int(obsid)
-    revision_result = db.session.execute(db.select(Revision).where(Revision.obsid==obsid).order_by(Revision.revision_number)).scalars().all()
-    is_approved = False
-    for rev in revision_result:
-        if rev.kind == 'asis':
-            is_approved = True
-        elif rev.kind == 'remove':
-            is_approved = False
-    return is_approved
+    #: Only the latest revision adding to or removing from the approved list determines the approval state
+    latest_kind = db.session.execute(_LATEST_APPROVAL_KIND, {'obsid': obsid}).scalar()
+    return latest_kind == 'asis'
 
 def has_open_revision(obsid):
     """
@@ -325,13 +389,7 @@ def has_open_revision(obsid):
 
     :rtype: bool
     """
-    result = db.session.execute(select(Revision, Signoff).join(Revision.signoff).where(Revision.obsid == obsid)).all()
-    has_open_revision = False
-    for revs, signs in result:
-        if is_open(signs):
-            has_open_revision = True
-            break
-    return has_open_revision
+    return db.session.execute(_HAS_OPEN_REVISION, {'obsid': obsid}).scalar()
 
 def remove(revision_id, signoff_id, column):
     """
@@ -340,17 +398,21 @@ def remove(revision_id, signoff_id, column):
     if column == 'revision':
         db.session.execute(delete(Revision).where(Revision.id == revision_id))
     else:
-        signoff = db.session.execute(select(Signoff).where(Signoff.id == signoff_id)).scalar_one()
+        signoff = _get_one(Signoff, signoff_id)
         setattr(signoff, f"{column}_status", 'Pending')
         setattr(signoff, f"{column}_signoff_id", None)
         setattr(signoff, f"{column}_time", None)
         db.session.add(signoff)
     db.session.commit()
 
+_STORAGE_SHAPE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z') #: Strings shaped exactly as STORAGE_FORMAT, which take the fromisoformat() fast path
+_last_epoch_format = DATETIME_FORMATS[0] #: Format of the last string parsed by to_epoch(), tried first on the next call
+
 def to_epoch(time):
     """
     Convert variety of time input to epoch time
     """
+    global _last_epoch_format
     if time is None:
         return None
     elif isinstance(time,(int, float)):
@@ -360,11 +422,19 @@ def to_epoch(time):
     elif isinstance(time,str):
         x = time.replace('::', ':')
         x = x.split('.')[0]
-        for format in DATETIME_FORMATS:
+        if _STORAGE_SHAPE.fullmatch(x):
             try:
-                return datetime.strptime(x,format).timestamp()
+                #: Fast path for the stored ISO 8601 format. The timezone is dropped so the 'Z' suffix is read in local time, as STORAGE_FORMAT is.
+                return datetime.fromisoformat(x).replace(tzinfo=None).timestamp()
             except ValueError:
                 pass
+        for format in (_last_epoch_format, *DATETIME_FORMATS):
+            try:
+                epoch = datetime.strptime(x,format).timestamp()
+            except ValueError:
+                continue
+            _last_epoch_format = format
+            return epoch
 
 #
 # --- Scheduler Specific Convenience Functions
@@ -376,11 +446,36 @@ def pull_schedule(begin = datetime.now() - timedelta(days=30)):
     query = select(Schedule).where(Schedule.start > begin).order_by(Schedule.start)
     return db.session.execute(query).scalars().all()
 
+def _shift_schedule_order(order_id, step):
+    """
+    Shift the order_id of every schedule entry after the provided order_id by step, in a single UPDATE statement.
+    """
+    #: Loaded entries are not synchronized, but the affected ones are only read again after the commit expires them.
+    db.session.execute(update(Schedule).where(Schedule.order_id > order_id).values(order_id=Schedule.order_id + step),
+                       execution_options={'synchronize_session': False})
+
+def _adjacent_schedule_entries(sched):
+    """
+    Fetch the schedule entries directly before and after the provided entry in a single query.
+    """
+    query = select(Schedule).where(Schedule.order_id.in_((sched.order_id - 1, sched.order_id + 1)))
+    adjacent = {}
+    for entry in db.session.execute(query).scalars():
+        if entry.order_id in adjacent:
+            #: order_id is not enforced as unique, so refuse to guess between duplicated neighbours
+            raise MultipleResultsFound(f"Multiple schedule entries with order_id {entry.order_id}")
+        adjacent[entry.order_id] = entry
+    try:
+        return adjacent[sched.order_id - 1], adjacent[sched.order_id + 1]
+    except KeyError:
+        #: Same failures as the individual scalar_one() fetches of each adjacent entry
+        raise NoResultFound(f"No adjacent schedule entry for order_id {sched.order_id}")
+
 def unlock_schedule_entry(schedule_id):
     """
     Undo signup for a TOO scheduled time duration entry
     """
-    sched = db.session.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one()
+    sched = _get_one(Schedule, schedule_id)
     sched.user_id = None
     sched.assigner_id = None
     db.session.commit()
@@ -389,7 +484,7 @@ def split_schedule_entry(schedule_id):
     """
     Add a new time period entry to the table and adjusting the order and start / stop time as necessary.
     """
-    sched = db.session.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one()
+    sched = _get_one(Schedule, schedule_id)
     old_start = sched.start
     old_stop = sched.stop
     diff = (old_stop - old_start).total_seconds()
@@ -406,9 +501,7 @@ def split_schedule_entry(schedule_id):
     # --- adjust existing orms to make room for new entry.
     #
     sched.stop = new_stop
-    result = db.session.execute(select(Schedule).where(Schedule.order_id > sched.order_id)).scalars().all()
-    for entry in result:
-        entry.order_id += 1
+    _shift_schedule_order(sched.order_id, 1)
     #
     # --- Insert the new split entry
     #
@@ -424,11 +517,10 @@ def delete_schedule_entry(schedule_id):
     """
     Remove the time period entry from the table, editing the unlocked adjacent entires to fill in the gaps.
     """
-    sched = db.session.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one()
+    sched = _get_one(Schedule, schedule_id)
     duration = (sched.stop - sched.start).total_seconds()
 
-    prev_sched = db.session.execute(select(Schedule).where(Schedule.order_id == sched.order_id - 1)).scalar_one()
-    next_sched = db.session.execute(select(Schedule).where(Schedule.order_id == sched.order_id + 1)).scalar_one()
+    prev_sched, next_sched = _adjacent_schedule_entries(sched)
 
     #: First check the adjacent periods for determining how we can edit them
     can_edit_prev = prev_sched.user is None
@@ -442,9 +534,7 @@ def delete_schedule_entry(schedule_id):
         if prev_duration + duration <= 518400:
             #: Able to only edit previous entry
             prev_sched.stop = sched.stop
-            result = db.session.execute(select(Schedule).where(Schedule.order_id > sched.order_id)).scalars().all()
-            for entry in result:
-                entry.order_id -= 1
+            _shift_schedule_order(sched.order_id, -1)
             db.session.execute(delete(Schedule).where(Schedule.id == sched.id))
             db.session.commit()
             flash("Row Removed. Fit duration into previous entry")
@@ -454,9 +544,7 @@ def delete_schedule_entry(schedule_id):
         if next_duration + duration <= 518400:
             #: Able to only edit next entry
             next_sched.start = sched.start
-            result = db.session.execute(select(Schedule).where(Schedule.order_id > sched.order_id)).scalars().all()
-            for entry in result:
-                entry.order_id -= 1
+            _shift_schedule_order(sched.order_id, -1)
             db.session.execute(delete(Schedule).where(Schedule.id == sched.id))
             db.session.commit()
             flash("Row Removed. Fit duration into next entry")
@@ -467,9 +555,7 @@ def delete_schedule_entry(schedule_id):
             #: Rare edge case in which are removing an entry that is spread between the monday to sunday cycle.
             prev_sched.stop = get_next_weekday(SUNDAY,sched.start)
             next_sched.start = get_next_weekday(MONDAY,prev_sched.stop)
-            result = db.session.execute(select(Schedule).where(Schedule.order_id > sched.order_id)).scalars().all()
-            for entry in result:
-                entry.order_id -= 1
+            _shift_schedule_order(sched.order_id, -1)
             db.session.execute(delete(Schedule).where(Schedule.id == sched.id))
             db.session.commit()
             flash("Row Removed. Fit duration between previous and next entry with changeover at start of workweek.")
@@ -487,19 +573,18 @@ def update_schedule_entry(schedule_id, user_id, start_string, stop_string):
     but calculates difference as less than or equal to six days since the default datetime value puts the stop as
     the start of the day, whereas we reference the end of the day.
     """
-    sched = db.session.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one()
+    sched = _get_one(Schedule, schedule_id)
     user_id = coerce(user_id)
-    #: Cannot record the start and stop strings in the url as back slashes since the browser interprets that as a different page.
-    start = datetime.strptime(start_string, "%B-%d-%Y")
-    stop = datetime.strptime(stop_string, "%B-%d-%Y")
+    #: The start and stop are recorded in the url as ISO 8601 date strings.
+    start = datetime.fromisoformat(start_string)
+    stop = datetime.fromisoformat(stop_string)
     duration = (stop - start).total_seconds()
     if duration > 518400:
         flash("Updated entry exceeds typical week duration. Please Correct.")
         return None
     elif duration < 518400:
         #: Update to schedule with a partial split. Verify adjacently split values.
-        prev_sched = db.session.execute(select(Schedule).where(Schedule.order_id == sched.order_id - 1)).scalar_one()
-        next_sched = db.session.execute(select(Schedule).where(Schedule.order_id == sched.order_id + 1)).scalar_one()
+        prev_sched, next_sched = _adjacent_schedule_entries(sched)
 
         prev_duration = (prev_sched.stop - prev_sched.start).total_seconds()
         next_duration = (next_sched.stop - next_sched.start).total_seconds()
@@ -529,7 +614,6 @@ def update_schedule_entry(schedule_id, user_id, start_string, stop_string):
     sched.stop = stop
     #: Editing the entry possible. Change the listed user
     if user_id is not None:
-        sched = db.session.execute(select(Schedule).where(Schedule.id == schedule_id)).scalar_one()
         sched.user_id = user_id
         sched.assigner_id = current_user.id
         subject = 'Update in TOO POC Duty Signup'
@@ -537,7 +621,7 @@ def update_schedule_entry(schedule_id, user_id, start_string, stop_string):
             content = f"{sched.user.full_name} ({sched.user.username}) has signed up for POC duty on the following period(s):\n\n"
         else:
             content = f"{sched.user.full_name} ({sched.user.username}) has been assigned POC duty by {current_user.full_name} ({current_user.username}) on the following period(s):\nIf this is unexpected. Please contact the assigner.\n\n"
-        content += f"Start: {start.strftime("%B %d %Y")}\nStop:  {stop.strftime("%B %d %Y")}\n"
+        content += f"Start: {start:%B %d %Y}\nStop:  {stop:%B %d %Y}\n"
         to = [sched.user.email, current_user.email]
         mail.send_email(content, subject, to)
     else:
@@ -25,105 +25,46 @@ import os
 import re
 import json
 import itertools
-from math import sqrt
+from functools import lru_cache
+from math import cos, radians
 from datetime import datetime, timedelta
 import astropy.table
 from astropy.coordinates import Angle
 from flask import current_app
 #
-# --- Classes
+# --- Iterators
 #
-class IterateRecords:
-    """Iterating through a set of records-oriented objects"""
-    def __init__(self,*args):
-        self.list_set = []
-        self.num_lists = len(args)
-        for arg in args:
-            if not isinstance(arg,list):
-                self.list_set.append([])
-            else:
-                self.list_set.append(arg)
-        self.top_level_iterator = enumerate(itertools.zip_longest(*self.list_set,fillvalue={}))
-        _ = next(self.top_level_iterator)
-        self.order = _[0]
-        self.keys = set()
-        for i in _[1]:
-            self.keys = self.keys.union(set(i.keys()))
+def iterate_records(*args):
+    """
+    Iterate through a set of records-oriented objects, yielding the rank order, parameter name, and tuple of that parameter's values in each object.
+    """
+    list_set = [arg if isinstance(arg, list) else [] for arg in args]
+    for order, records in enumerate(itertools.zip_longest(*list_set, fillvalue={})):
         #: Iterate over the keys in the record
-        self.inner_iterator = iter(self.keys)
-        self.inner_level = _[1]
-    
-    def __iter__(self):
-        return self
+        for param in set().union(*records):
+            yield order, param, tuple(record.get(param) for record in records)
 
-    
-    def __next__(self):
-        try:
-            curr_param = next(self.inner_iterator)
-            curr_values = [x.get(curr_param) for x in self.inner_level]
-            return self.order, curr_param, tuple(curr_values)
-        except StopIteration:
-            _ = next(self.top_level_iterator)
-            self.order = _[0]
-            self.keys = set()
-            for i in _[1]:
-                self.keys = self.keys.union(set(i.keys()))
-            #: Iterate over the keys in the record
-            self.inner_iterator = iter(self.keys)
-            self.inner_level = _[1]
-            
-        return self.__next__()
-
-class IterateColumns:
-    """Iterating through a columns-oriented objects"""
-    
-    @staticmethod
-    def get_col(obj,key):
-        if obj is None:
-            return []
-        else:
-            return obj.get(key) or []
-    
-    def __init__(self,*args):
-        self.dict_set = []
-        self.num_dict = len(args)
-        for arg in args:
-            if not isinstance(arg,dict):
-                self.dict_set.append({})
-            else:
-                self.dict_set.append(arg)
-        self.keys = set()
-        for i in self.dict_set:
-            self.keys = self.keys.union(set(i.keys()))
-
-        self.top_level_iterator = iter(self.keys)
-        _ = next(self.top_level_iterator)
-        self.parameter = _
-        self.inner_level = [self.get_col(x,_) for x in self.dict_set]
-        self.inner_iterator = enumerate(itertools.zip_longest(*self.inner_level,fillvalue=None))
-        
-    def __iter__(self):
-        return self
-    
-    def __next__(self):
-        try:
-            ordr, curr_values = next(self.inner_iterator)
-            return ordr, self.parameter, tuple(curr_values)
-        except StopIteration:
-            _ = next(self.top_level_iterator)
-        self.parameter = _
-        self.inner_level = [self.get_col(x,_) for x in self.dict_set]
-        self.inner_iterator = enumerate(itertools.zip_longest(*self.inner_level,fillvalue=None))
-        return self.__next__()
+def iterate_columns(*args):
+    """
+    Iterate through a set of columns-oriented objects, yielding the rank order, parameter name, and tuple of that parameter's values in each object.
+    """
+    dict_set = [arg if isinstance(arg, dict) else {} for arg in args]
+    for param in set().union(*dict_set):
+        columns = [obj.get(param) or [] for obj in dict_set]
+        for order, values in enumerate(itertools.zip_longest(*columns, fillvalue=None)):
+            yield order, param, tuple(values)
 
 #
 # --- Globals
 #
-NULL_LIST = [None,'',' ','<Blank>','N/A','NA','NONE','NULL','Na','None','Null','none','null']
+NULL_SET = frozenset((None,'',' ','<Blank>','N/A','NA','NONE','NULL','Na','None','Null','none','null'))
 OCAT_DATETIME_FORMAT = "%b %d %Y %I:%M%p" #: Warning Ocat Datetimes are stored without a leading zero in the day. This can cause python comparisons to fail
 USINT_DATETIME_FORMAT = "%b %d %Y %H:%M"
 STORAGE_FORMAT = '%Y-%m-%dT%H:%M:%SZ' #: ISO 8601 format. Used in storage for Usint SQL Database
 DATETIME_FORMATS = [USINT_DATETIME_FORMAT, OCAT_DATETIME_FORMAT, STORAGE_FORMAT, '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M','%m:%d:%Y:%H:%M:%S', '%m:%d:%Y:%H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M',]
+#: DATETIME_FORMATS split by whether the string leads with a month name, so that a parse only tries formats it could match
+_MONTH_NAME_FORMATS = tuple(format for format in DATETIME_FORMATS if format.startswith('%b'))
+_NUMERIC_FORMATS = tuple(format for format in DATETIME_FORMATS if not format.startswith('%b'))
 
 #
 # --- Parameter selection for time, roll, and window ranks
@@ -133,19 +74,26 @@ ROLL_RANK_PARAMS = {'roll_constraint', 'roll_180', 'roll', 'roll_tolerance'}
 WINDOW_RANK_PARAMS = {'chip', 'start_row', 'start_column', 'width', 'height', 'lower_threshold', 'pha_range', 'sample'}
 ALL_RANK_PARAMS = TIME_RANK_PARAMS.union(ROLL_RANK_PARAMS).union(WINDOW_RANK_PARAMS)
 _SIGNOFF_COLUMNS = ('general', 'acis', 'acis_si', 'hrc_si', 'usint') #: Prefix names for the columns of Signoff
+_SIGNOFF_STATUS_ATTRS = tuple(f"{col}_status" for col in _SIGNOFF_COLUMNS) #: Status attribute names of Signoff
 
 #
 # --- Coercion section. Converting values to the correct data types.
 #
+def is_null(val):
+    """
+    Check whether the value is one of the NULL_SET representations of null. Only strings are hashed, so containers are never null.
+    """
+    return val is None or (isinstance(val, str) and val in NULL_SET)
+
 def coerce_none(val):
     """
-    Recursive function to convert containers of NULL_LIST values into the Python native None.
+    Recursive function to convert containers of NULL_SET values into the Python native None.
     """
     if isinstance(val, (list, tuple)):
         return [coerce_none(x) for x in val]
     elif isinstance(val, dict):
         return {k:coerce_none(v) for k,v in val.items()}
-    elif val in NULL_LIST:
+    elif is_null(val):
         return None
     return val
 
@@ -170,18 +118,29 @@ def coerce_time(val, output_time_format = STORAGE_FORMAT):
     if isinstance(val, str):
         x = val.replace('::', ':')
         x = x.split('.')[0]
-        for format in DATETIME_FORMATS:
-            try:
-                return datetime.strptime(x,format).strftime(output_time_format)
-            except ValueError:
-                pass
+        formatted = _format_time(x, output_time_format)
+        if formatted is not None:
+            return formatted
     return val
 
+@lru_cache(maxsize=4096)
+def _format_time(x, output_time_format):
+    """
+    Reformat a time string into the output time format, or None if it matches none of the DATETIME_FORMATS.
+    Ocat data repeats the same timestamps across ranks and revisions, so parses are reused.
+    """
+    for format in (_MONTH_NAME_FORMATS if x[:1].isalpha() else _NUMERIC_FORMATS):
+        try:
+            return datetime.strptime(x,format).strftime(output_time_format)
+        except ValueError:
+            pass
+    return None
+
 def coerce_to_json(val):
     """
     Coercion of python data type to a json-formatted string for data storage
     """
-    if val in NULL_LIST:
+    if is_null(val):
         return None
     elif isinstance(val, datetime):
         #: Convert to ISO 8601 string then store
@@ -212,12 +171,13 @@ def coerce(val, output_time_format = STORAGE_FORMAT):
     elif isinstance(val, dict):
         return {k:coerce(v, output_time_format) for k,v in val.items()}
     #: Null section
-    elif val in NULL_LIST:
+    elif is_null(val):
         return None
-    #: Number section
-    val = coerce_number(val)
-    if isinstance(val,(int,float)):
-        return val
+    #: Number section. A string led by a letter can only convert to a float if it spells nan or inf, so skip the failing int/float attempts.
+    if not (isinstance(val, str) and val[:1].isalpha() and val[:1] not in 'iInN'):
+        val = coerce_number(val)
+        if isinstance(val,(int,float)):
+            return val
     #: Time section if applicable
     val = coerce_time(val, output_time_format)
     #: Regular string
@@ -247,15 +207,23 @@ def check_obsid_in_or_list(obsids_list):
     :return or_dict: map of obsid to boolean if in the OR list
     :rtype: dict(bool)
     """
-    or_dict = {}
-    with open(os.path.join(current_app.config["OBS_SS"], 'scheduled_obs_list')) as f:
-        or_list = [int(line.strip().split()[0]) for line in f.readlines()]
-    for obsid in obsids_list:
-        if obsid in or_list:
-            or_dict[obsid] = True
-        else:
-            or_dict[obsid] = False
-    return or_dict
+    or_set = _read_or_list(os.path.join(current_app.config["OBS_SS"], 'scheduled_obs_list'))
+    return {obsid: obsid in or_set for obsid in obsids_list}
+
+_OR_LIST_CACHE = {} #: OR list file path to ((modification time, size), set of obsids)
+
+def _read_or_list(path):
+    """
+    Read the set of obsids in the OR list file, reparsing only when the file has changed since the last read.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _OR_LIST_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        with open(path) as f:
+            cached = (key, frozenset(int(line.split()[0]) for line in f))
+        _OR_LIST_CACHE[path] = cached
+    return cached[1]
 
 #
 # --- Comparison Functions
@@ -301,6 +269,17 @@ def approx_equals(first,second):
     else:
         return first == second
 
+#: Revision note flagged by a change request of the parameter
+_NOTE_BY_PARAM = {'targname': 'target_name_change',
+                  'comments': 'comment_change',
+                  'instrument': 'instrument_change',
+                  'grating': 'grating_change',
+                  'dither_flag': 'flag_change',
+                  'window_flag': 'flag_change',
+                  'roll_flag': 'flag_change',
+                  'spwindow_flag': 'flag_change',
+                  }
+
 def construct_notes(ocat_data, org_dict, req_dict):
     """
     Construct Revision notes and format into a JSON string
@@ -319,25 +298,12 @@ def construct_notes(ocat_data, org_dict, req_dict):
     #
     # --- Change Request Specific Warnings
     #
-    ra = None
-    dec = None
-    ora = None
-    odec = None
-    for param, val in req_dict.items():
-        if param == 'targname':
-            notes.update({'target_name_change':True})
-        elif param == 'comments':
-            notes.update({'comment_change': True})
-        elif param == 'instrument':
-            notes.update({'instrument_change': True})
-        elif param == 'grating':
-            notes.update({'grating_change': True})
-        elif param in ('dither_flag', 'window_flag', 'roll_flag', 'spwindow_flag'):
-            notes.update({'flag_change': True})
-        elif param == 'ra':
-            ra = val
-        elif param == 'dec':
-            dec = val
+    for param in req_dict:
+        note = _NOTE_BY_PARAM.get(param)
+        if note is not None:
+            notes[note] = True
+    ra = req_dict.get('ra')
+    dec = req_dict.get('dec')
     if ra is not None or dec is not None:
         ora = org_dict.get('ra')
         if ra is None:
@@ -353,14 +319,18 @@ def construct_notes(ocat_data, org_dict, req_dict):
     else:
         return None
 
+_LARGE_SHIFT_SQ = 0.1333 ** 2 #: Square of the 8 arcminute large coordinate shift, in degrees
+
 def is_large_coord_shift(ra,dec, ora, odec):
     """
     Boolean check for whether a coordinate change exceeds 8 arcminutes.
+    Uses the small angle separation, scaling the right ascension difference by the cosine of the mean declination.
     """
     if ora is None or odec is None:
         return False #: Instance of defining a TOO coordinates location. No need to check.
-    diff = sqrt((ora -ra)**2 + (odec - dec)**2)
-    return diff > 0.1333
+    dra = (ra - ora) * cos(radians(0.5 * (dec + odec)))
+    ddec = dec - odec
+    return dra * dra + ddec * ddec > _LARGE_SHIFT_SQ
 #
 #--- Conversion Functions
 #
@@ -382,27 +352,18 @@ def reorient_rank(ranks, orient):
         if orient == 'records':
             return ranks
         else:
-            columns = {}
-            for key, value in ranks[0].items():
-                columns[key] = [value]
-            for i in range(1,len(ranks)):
-                for key, value in ranks[i].items():
-                    columns[key].append(value)
-        return columns
+            #: Keep the parameters of the first rank. Ranks missing a parameter fill in None.
+            return {key: [rank.get(key) for rank in ranks] for key in ranks[0]}
                     
     elif isinstance(ranks,dict) and ranks != {}:
         #: Is columns
         if orient == 'columns':
             return ranks
         else:
-            records = []
             key_list = list(ranks.keys())
-            for i in range(len(ranks[key_list[0]])):
-                rec = {}
-                for key in key_list:
-                    rec[key] = ranks[key][i]
-                records.append(rec)
-        return records
+            #: The first column sets the number of ranks. Shorter columns fill in None.
+            rows = itertools.islice(itertools.zip_longest(*ranks.values()), len(ranks[key_list[0]]))
+            return [dict(zip(key_list, values)) for values in rows]
     else:
         raise ValueError(f"Incompatible Rank Object: {ranks}")
 
@@ -432,10 +393,10 @@ def convert_astropy_to_native(astropy_object, orient = None):
         # --- Similar argument to pandas dataframe for consistency but does not use pandas
         #
         if (orient == 'records') or (len(astropy_object) == 1 and orient is None):
-            result = []
-            for row in astropy_object:
-                result.append(convert_row_to_dict(row))
-            return result
+            #: Convert column by column, then transpose, rather than converting every cell of every row separately.
+            colnames = astropy_object.colnames
+            columns = [astropy_object[col].tolist() for col in colnames]
+            return [dict(zip(colnames, values)) for values in zip(*columns)]
         elif (orient == 'columns') or (len(astropy_object.colnames) == 1 and orient is None):
             result = {}
             for col in astropy_object.colnames:
@@ -455,6 +416,8 @@ def convert_astropy_to_native(astropy_object, orient = None):
     elif hasattr(astropy_object, 'tolist'):
         return astropy_object.tolist()
     
+_OBSID_SEPARATORS = re.compile(r'[\s,:;]+') #: Whitespace, comma, colon, or semicolon runs between obsid list elements
+
 def create_obsid_list(list_string, obsid = None):
     """
     Create a list of obsids from form input.
@@ -465,7 +428,7 @@ def create_obsid_list(list_string, obsid = None):
     if list_string.strip() == '':
         return []
     #: Split the input string into elements
-    raw_elements = [x for x in re.split(r'\s+|,|:|;', list_string) if x != '']
+    raw_elements = [x for x in _OBSID_SEPARATORS.split(list_string) if x != '']
     
     #: Combine into string replaceable format for dash parsing
     combined = ','.join(raw_elements)
@@ -544,12 +507,7 @@ def is_open(signoff_obj):
     """
     Returns boolean if the signoff entry still needs a signature.
     """
-    is_open = False
-    for attr in _SIGNOFF_COLUMNS:
-        if getattr(signoff_obj, f"{attr}_status") == 'Pending':
-            is_open = True
-            break
-    return is_open
+    return any(getattr(signoff_obj, attr) == 'Pending' for attr in _SIGNOFF_STATUS_ATTRS)
 
 def contains_non_none(obj):
     """
@@ -0,0 +1,21 @@
+"""
+**static_data.py**: Static JSON data shared across the Usint application
+
+:Author: W. Aaron (william.aaron@cfa.harvard.edu)
+:Last Updated: Oct 16, 2026
+
+:NOTE: The static JSON files are read once when this module is first imported.
+Blueprints and supplemental modules should import these constants rather than opening the files themselves.
+
+"""
+import os
+import json
+
+stat_dir =  os.path.join(os.path.dirname(os.path.abspath(__file__)),'..', 'static')
+
+with open(os.path.join(stat_dir, 'labels.json')) as f:
+    LABELS = json.load(f) #: Ocat parameter name to visual label
+with open(os.path.join(stat_dir, 'parameter_selections.json')) as f:
+    PARAM_SELECTIONS = json.load(f) #: Sets of parameters for various purposes across the application
+with open(os.path.join(stat_dir, 'color.json')) as f:
+    COLORS = json.load(f) #: Color name to rgb string